@@ -4,7 +4,7 @@ import json
 import os
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .interaction.keybinds import DEFAULT_STOP_KEY, normalize_stop_key
 
@@ -12,6 +12,11 @@ CONFIG_VERSION = 5
 APP_CONFIG_DIR_NAME = "AutoScrapper"
 CONFIG_FILE_NAME = "config.json"
 
+# Last parsed config, keyed by (path, mtime_ns, size) so edits made outside
+# the app are still picked up.
+_ConfigStamp = Tuple[str, int, int]
+_config_cache: Optional[Tuple[_ConfigStamp, Dict[str, Any]]] = None
+
 
 @dataclass(frozen=True)
 class ScanSettings:
@@ -77,8 +82,28 @@ def _raw_with_aliases(raw: Dict[str, Any], *keys: str) -> Any:
     return None
 
 
+def _config_stamp(path: Path) -> Optional[_ConfigStamp]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
 def _load_config_dict() -> Dict[str, Any]:
+    """
+    Parsed config file contents; re-read only when the file changes.
+
+    Callers get a shallow copy so they can set top-level keys before saving.
+    """
+    global _config_cache
     path = config_path()
+    stamp = _config_stamp(path)
+    if stamp is None:
+        return {}
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return dict(_config_cache[1])
+
     try:
         raw = json.loads(path.read_text(encoding="utf-8"))
     except FileNotFoundError:
@@ -86,13 +111,18 @@ def _load_config_dict() -> Dict[str, Any]:
     except (OSError, json.JSONDecodeError):
         return {}
 
-    return raw if isinstance(raw, dict) else {}
+    data = raw if isinstance(raw, dict) else {}
+    _config_cache = (stamp, data)
+    return dict(data)
 
 
 def _save_config_dict(payload: Dict[str, Any]) -> None:
+    global _config_cache
     path = config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    stamp = _config_stamp(path)
+    _config_cache = (stamp, dict(payload)) if stamp is not None else None
 
 
 def _from_raw_scan_settings(raw: Any) -> ScanSettings:
@@ -193,8 +223,12 @@ def load_scan_settings() -> ScanSettings:
 
 def save_scan_settings(settings: ScanSettings) -> None:
     payload = _load_config_dict()
+    scan = asdict(settings)
+    if payload.get("version") == CONFIG_VERSION and payload.get("scan") == scan:
+        # Saving an unchanged form should not rewrite the config file.
+        return
     payload["version"] = CONFIG_VERSION
-    payload["scan"] = asdict(settings)
+    payload["scan"] = scan
     _save_config_dict(payload)
 
 
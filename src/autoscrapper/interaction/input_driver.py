@@ -24,6 +24,33 @@ if sys.platform == "win32":
     _VkKeyScanW.argtypes = [wintypes.WCHAR]
     _VkKeyScanW.restype = wintypes.SHORT
 
+    _INPUT_MOUSE = 0
+    _MOUSEEVENTF_LEFTDOWN = 0x0002
+    _MOUSEEVENTF_LEFTUP = 0x0004
+    _MOUSEEVENTF_RIGHTDOWN = 0x0008
+    _MOUSEEVENTF_RIGHTUP = 0x0010
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _SendInput = _USER32.SendInput
+    _SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _SendInput.restype = wintypes.UINT
+
     _SPECIAL_VK: dict[str, int] = {
         "escape": 0x1B,
         "enter": 0x0D,
@@ -70,11 +97,25 @@ if sys.platform == "win32":
     def moveTo(x: int, y: int, duration: float = 0.0) -> None:
         _pydirectinput.moveTo(int(x), int(y), duration=duration)
 
+    def _send_button_click(down_flag: int, up_flag: int) -> None:
+        """
+        Send a button down+up pair in a single SendInput call.
+        """
+        events = (_INPUT * 2)()
+        for event, flag in zip(events, (down_flag, up_flag)):
+            event.type = _INPUT_MOUSE
+            event.mi.dwFlags = flag
+        sent = _SendInput(len(events), events, ctypes.sizeof(_INPUT))
+        if sent != len(events):
+            raise ctypes.WinError(ctypes.get_last_error())
+
     def leftClick(x: int, y: int) -> None:
-        _pydirectinput.click(x=int(x), y=int(y), button="left")
+        _pydirectinput.moveTo(int(x), int(y))
+        _send_button_click(_MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP)
 
     def rightClick(x: int, y: int) -> None:
-        _pydirectinput.click(x=int(x), y=int(y), button="right")
+        _pydirectinput.moveTo(int(x), int(y))
+        _send_button_click(_MOUSEEVENTF_RIGHTDOWN, _MOUSEEVENTF_RIGHTUP)
 
     def vscroll(clicks: int, interval: float = 0.0) -> None:
         if clicks == 0:
@@ -49,7 +49,7 @@ CELL_SIZE_TOLERANCE = 0.3
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cell:
     """Represents a single grid cell."""
 
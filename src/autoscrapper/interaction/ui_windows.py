@@ -7,6 +7,7 @@ import time
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+import cv2
 import mss
 import numpy as np
 import pywinctl as pwc
@@ -73,7 +74,12 @@ SCROLL_MOVE_DURATION = 0.5
 SCROLL_INTERVAL = 0.04
 SCROLL_SETTLE_DELAY = 0.05
 
+# Stop-key polls closer together than this are skipped. Both input backends
+# latch presses until the next poll, so a skipped poll never loses a press.
+STOP_KEY_POLL_INTERVAL = 0.05
+
 _MSS_LOCAL = threading.local()
+_last_stop_key_poll = 0.0
 
 
 @dataclass(frozen=True)
@@ -143,6 +149,11 @@ def abort_if_escape_pressed(stop_key: str = DEFAULT_STOP_KEY) -> None:
     """
     Raise KeyboardInterrupt if the configured stop key is down.
     """
+    global _last_stop_key_poll
+    now = time.monotonic()
+    if now - _last_stop_key_poll < STOP_KEY_POLL_INTERVAL:
+        return
+    _last_stop_key_poll = now
     if stop_key_pressed(stop_key):
         raise KeyboardInterrupt(f"{stop_key} pressed")
 
@@ -262,6 +273,13 @@ def _reset_mss() -> None:
     _MSS_LOCAL.instance = None
 
 
+def close_capture() -> None:
+    """
+    Release this thread's screen-capture handles; the next capture reopens them.
+    """
+    _reset_mss()
+
+
 def _is_mss_thread_handle_error(exc: Exception) -> bool:
     """
     Detect stale-thread-handle MSS failures that can recover by recreating MSS.
@@ -270,9 +288,14 @@ def _is_mss_thread_handle_error(exc: Exception) -> bool:
     return "srcdc" in text or "thread._local" in text
 
 
-def capture_region(region: Tuple[int, int, int, int]) -> np.ndarray:
+def capture_region(
+    region: Tuple[int, int, int, int], *, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Capture a BGR screenshot of the given region (left, top, width, height).
+
+    When `out` is a matching (height, width, 3) uint8 array the pixels are
+    written into it and it is returned, avoiding a fresh allocation.
     """
     left, top, width, height = region
     if width <= 0 or height <= 0:
@@ -303,8 +326,16 @@ def capture_region(region: Tuple[int, int, int, int]) -> np.ndarray:
             ) from exc
 
     frame = np.asarray(shot)
+    height, width = frame.shape[:2]
+    if out is not None and (out.shape != (height, width, 3) or out.dtype != np.uint8):
+        out = None
     if frame.shape[2] == 4:
-        frame = frame[:, :, :3]  # drop alpha, keep BGR order
+        # Drop alpha, keep BGR order. cvtColor is SIMD; copying the strided
+        # frame[:, :, :3] view through numpy is an order of magnitude slower.
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=out)
+    if out is not None:
+        np.copyto(out, frame)
+        return out
     return np.ascontiguousarray(frame)
 
 
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 DEFAULT_RULES_PATH = Path(__file__).with_name("items_rules.default.json")
 CUSTOM_RULES_PATH = Path(__file__).with_name("items_rules.custom.json")
 
+_RulesStamp = Tuple[int, int]
+_metadata_cache: Dict[Path, Tuple[_RulesStamp, dict]] = {}
+
 
 def active_rules_path() -> Path:
     return CUSTOM_RULES_PATH if CUSTOM_RULES_PATH.exists() else DEFAULT_RULES_PATH
@@ -39,6 +42,25 @@ def load_rules(path: Optional[Path] = None) -> dict:
     return _coerce_payload(raw)
 
 
+def load_rules_metadata(path: Optional[Path] = None) -> dict:
+    """
+    Metadata block of a rules file; the file is re-parsed only when it changes.
+    """
+    rules_path = path or active_rules_path()
+    try:
+        stat = rules_path.stat()
+    except OSError:
+        return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _metadata_cache.get(rules_path)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
+    metadata = load_rules(rules_path)["metadata"]
+    _metadata_cache[rules_path] = (stamp, metadata)
+    return dict(metadata)
+
+
 def save_rules(payload: dict, path: Path) -> None:
     items = payload.get("items")
     if not isinstance(items, list):
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -23,6 +27,11 @@ INFOBOX_CLOSE_DIVISOR = 150.0
 INFOBOX_EDGE_FRACTION = 0.55
 INFOBOX_MIN_AREA = 1000
 
+# Empty-slot heuristic thresholds (see is_empty_cell)
+EMPTY_BRIGHT_FRACTION_MAX = 0.03
+EMPTY_GRAY_VAR_MAX = 700
+EMPTY_EDGE_FRACTION_MAX = 0.09
+
 # Item title placement inside the infobox (relative to infobox size)
 TITLE_HEIGHT_REL = 0.18
 
@@ -34,8 +43,22 @@ RECYCLE_CONFIRM_RECT_NORM = (0.5058, 0.6274, 0.1777, 0.0544)
 # Matches the always-visible "items in stash" label near the top-left.
 INVENTORY_COUNT_RECT_NORM = (0.0734, 0.1583, 0.0380, 0.0231)
 
+# Sums the three per-channel values of a pixel (used with cv2.transform).
+_CHANNEL_SUM = np.ones((1, 3), dtype=np.float32)
+# uint8 -> float32 square table, so squaring a channel difference is one cv2.LUT.
+_SQUARE_LUT = (np.arange(256, dtype=np.float32) ** 2).reshape(1, 256)
+
 _OCR_DEBUG_DIR: Optional[Path] = None
 
+# Recent infobox OCR results keyed by a digest of the binarized crop. Stacks of
+# the same item render identical infoboxes, so repeats skip Tesseract.
+_INFOBOX_OCR_CACHE_SIZE = 256
+_InfoboxOcrFields = Tuple[
+    str, str, Optional[Tuple[int, int, int, int]], Optional[Tuple[int, int, int, int]]
+]
+_infobox_ocr_cache: "OrderedDict[bytes, _InfoboxOcrFields]" = OrderedDict()
+_infobox_ocr_cache_lock = threading.Lock()
+
 
 @dataclass
 class InfoboxOcrResult:
@@ -72,13 +95,13 @@ def is_empty_cell(
     Empirically tuned heuristic: mostly dark with low texture and few edges.
     """
     # Primary test: looks dark with few bright pixels
-    if bright_fraction >= 0.03:
+    if bright_fraction >= EMPTY_BRIGHT_FRACTION_MAX:
         return False
 
     # Fallback
-    if gray_var > 700:
+    if gray_var > EMPTY_GRAY_VAR_MAX:
         return False
-    if edge_fraction > 0.09:
+    if edge_fraction > EMPTY_EDGE_FRACTION_MAX:
         return False
 
     return True
@@ -123,24 +146,122 @@ def is_slot_empty(
 ) -> bool:
     """
     Decide if an inventory slot is visually empty using slot metrics.
+
+    Same verdict as `is_empty_cell(*slot_metrics(...))`, but each metric is
+    only computed when the cheaper ones have not already ruled the slot full.
     """
-    bright_fraction, gray_var, edge_fraction = slot_metrics(
-        slot_bgr, v_thresh, canny1, canny2
-    )
+    if slot_bgr.size == 0:
+        raise ValueError("slot_bgr is empty (ROI outside image bounds?)")
+
+    # HSV V is max(B, G, R); skip the full HSV conversion.
+    blue, green, red = cv2.split(slot_bgr)
+    value = cv2.max(cv2.max(blue, green), red)
+    bright_fraction = float(np.count_nonzero(value > v_thresh)) / value.size
+    if bright_fraction >= EMPTY_BRIGHT_FRACTION_MAX:
+        return False
+
+    gray = cv2.cvtColor(slot_bgr, cv2.COLOR_BGR2GRAY)
+    gray_var = float(gray.var())
+    if gray_var > EMPTY_GRAY_VAR_MAX:
+        return False
+
+    edges = cv2.Canny(gray, canny1, canny2)
+    edge_fraction = float(np.count_nonzero(edges)) / edges.size
     return is_empty_cell(bright_fraction, gray_var, edge_fraction)
 
 
+def are_slots_empty(
+    frame_bgr: np.ndarray,
+    rects: Sequence[Tuple[int, int, int, int]],
+    v_thresh: int = 120,
+    canny1: int = 50,
+    canny2: int = 150,
+) -> List[bool]:
+    """
+    Batched `is_slot_empty` for (x, y, w, h) slot rects inside one frame.
+
+    Equally sized slots are gathered into one stack so brightness and variance
+    are reduced in a single pass; Canny only runs on slots those cheaper checks
+    leave open. Slots outside the frame count as not empty.
+    """
+    slots = [frame_bgr[y : y + h, x : x + w] for x, y, w, h in rects]
+    visible = [i for i, slot in enumerate(slots) if slot.size > 0]
+    results = [False] * len(slots)
+    if not visible:
+        return results
+
+    shape = slots[visible[0]].shape
+    if any(slots[i].shape != shape for i in visible):
+        for i in visible:
+            results[i] = is_slot_empty(slots[i], v_thresh, canny1, canny2)
+        return results
+
+    count = len(visible)
+    slot_h = shape[0]
+    stacked = np.concatenate([slots[i] for i in visible], axis=0)
+
+    # HSV V is max(B, G, R); both conversions are per-pixel, so stacking is exact.
+    blue, green, red = cv2.split(stacked)
+    value = cv2.max(cv2.max(blue, green), red)
+    bright_fractions = (value > v_thresh).reshape(count, -1).mean(axis=1)
+    gray = cv2.cvtColor(stacked, cv2.COLOR_BGR2GRAY)
+    gray_vars = gray.reshape(count, -1).var(axis=1)
+
+    for pos, i in enumerate(visible):
+        bright_fraction = float(bright_fractions[pos])
+        gray_var = float(gray_vars[pos])
+        if (
+            bright_fraction >= EMPTY_BRIGHT_FRACTION_MAX
+            or gray_var > EMPTY_GRAY_VAR_MAX
+        ):
+            continue
+        edges = cv2.Canny(gray[pos * slot_h : (pos + 1) * slot_h], canny1, canny2)
+        edge_fraction = float(np.count_nonzero(edges)) / edges.size
+        results[i] = is_empty_cell(bright_fraction, gray_var, edge_fraction)
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def _box_kernel(size: int) -> np.ndarray:
+    return np.ones((size, size), dtype=np.uint8)
+
+
 def _odd(value: int) -> int:
     return value if value % 2 == 1 else value + 1
 
 
+def _min_squared_distance(bgr_image: np.ndarray, target: Tuple[float, ...]) -> float:
+    # Squared channel distances are small integers, exact in float32; sum
+    # them with cv2.transform and take the minimum.
+    diff = cv2.absdiff(bgr_image, target)
+    sq_dist = cv2.transform(cv2.LUT(diff, _SQUARE_LUT), _CHANNEL_SUM)
+    return cv2.minMaxLoc(sq_dist)[0]
+
+
 def _compute_auto_tolerance(
     bgr_image: np.ndarray, target_bgr: np.ndarray
 ) -> Tuple[int, float]:
-    image_f = bgr_image.astype(np.float32)
-    target_f = target_bgr.astype(np.float32)
-    dist = np.linalg.norm(image_f - target_f, axis=2)
-    min_dist = float(dist.min()) if dist.size else float("inf")
+    if bgr_image.size == 0:
+        min_dist = float("inf")
+    else:
+        target = tuple(float(c) for c in target_bgr) + (0.0,)
+        # A pixel within INFOBOX_TOLERANCE_MAX of the target is within it on
+        # every channel, so the exact pass only needs the bounding box of that
+        # per-channel window. The whole frame is measured only when nothing
+        # there is close enough to pin down the minimum.
+        color = target_bgr.astype(np.int16)
+        near = cv2.inRange(
+            bgr_image,
+            np.clip(color - INFOBOX_TOLERANCE_MAX, 0, 255).astype(np.uint8),
+            np.clip(color + INFOBOX_TOLERANCE_MAX, 0, 255).astype(np.uint8),
+        )
+        min_sq = float("inf")
+        if cv2.countNonZero(near):
+            x, y, w, h = cv2.boundingRect(near)
+            min_sq = _min_squared_distance(bgr_image[y : y + h, x : x + w], target)
+        if min_sq > INFOBOX_TOLERANCE_MAX**2:
+            min_sq = _min_squared_distance(bgr_image, target)
+        min_dist = float(np.sqrt(min_sq))
     tol = int(np.ceil(min_dist + INFOBOX_TOLERANCE_PADDING))
     tol = int(np.clip(tol, INFOBOX_TOLERANCE_MIN, INFOBOX_TOLERANCE_MAX))
     return tol, min_dist
@@ -292,10 +413,31 @@ def _save_infobox_detection_debug_images(
     _save_debug_image("infobox_detect_overlay", overlay)
 
 
-def find_infobox_with_debug(bgr_image: np.ndarray) -> InfoboxDetectionResult:
+def _close_kernel_size(frame_width: int, frame_height: int) -> int:
+    """
+    Closing kernel size for a window of the given size.
+    """
+    return _odd(
+        int(
+            np.clip(
+                round(min(frame_width, frame_height) / INFOBOX_CLOSE_DIVISOR),
+                INFOBOX_CLOSE_KERNEL_MIN,
+                INFOBOX_CLOSE_KERNEL_MAX,
+            )
+        )
+    )
+
+
+def find_infobox_with_debug(
+    bgr_image: np.ndarray,
+    reference_size: Optional[Tuple[int, int]] = None,
+) -> InfoboxDetectionResult:
     """
     Detect the infobox/context-menu panel using adaptive color tolerance and
     contour refinement. Returns the detected rect plus diagnostics.
+
+    reference_size: (width, height) of the full window when `bgr_image` is a
+    crop of it, so morphology is sized exactly as for a full-window capture.
     """
     if bgr_image.size == 0:
         return InfoboxDetectionResult(
@@ -312,15 +454,8 @@ def find_infobox_with_debug(bgr_image: np.ndarray) -> InfoboxDetectionResult:
         )
 
     img_h, img_w = bgr_image.shape[:2]
-    close_k = _odd(
-        int(
-            np.clip(
-                round(min(img_w, img_h) / INFOBOX_CLOSE_DIVISOR),
-                INFOBOX_CLOSE_KERNEL_MIN,
-                INFOBOX_CLOSE_KERNEL_MAX,
-            )
-        )
-    )
+    ref_w, ref_h = reference_size if reference_size is not None else (img_w, img_h)
+    close_k = _close_kernel_size(ref_w, ref_h)
 
     tolerance, min_dist = _compute_auto_tolerance(bgr_image, INFOBOX_COLOR_BGR)
     color = INFOBOX_COLOR_BGR.astype(np.int16)
@@ -328,13 +463,26 @@ def find_infobox_with_debug(bgr_image: np.ndarray) -> InfoboxDetectionResult:
     upper = np.clip(color + tolerance, 0, 255).astype(np.uint8)
 
     mask = cv2.inRange(bgr_image, lower, upper)
-    close_kernel = np.ones((close_k, close_k), dtype=np.uint8)
-    open_kernel = np.ones((3, 3), dtype=np.uint8)
-
-    mask_proc = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, close_kernel, iterations=2)
-    mask_proc = cv2.morphologyEx(mask_proc, cv2.MORPH_OPEN, open_kernel, iterations=1)
-
-    contours, _ = cv2.findContours(mask_proc, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    close_kernel = _box_kernel(close_k)
+    open_kernel = _box_kernel(3)
+
+    # Morphology only has to cover the mask's bounding box plus the reach of
+    # the close (2 iterations) and open passes; the rest of the frame stays 0.
+    mask_proc = np.zeros_like(mask)
+    contours: Sequence[np.ndarray] = ()
+    bx, by, bw, bh = cv2.boundingRect(mask)
+    if bw > 0 and bh > 0:
+        pad = 2 * close_k + 2
+        x0, y0 = max(0, bx - pad), max(0, by - pad)
+        x1, y1 = min(img_w, bx + bw + pad), min(img_h, by + bh + pad)
+        roi = cv2.morphologyEx(
+            mask[y0:y1, x0:x1], cv2.MORPH_CLOSE, close_kernel, iterations=2
+        )
+        roi = cv2.morphologyEx(roi, cv2.MORPH_OPEN, open_kernel, iterations=1)
+        mask_proc[y0:y1, x0:x1] = roi
+        contours, _ = cv2.findContours(
+            roi, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE, offset=(x0, y0)
+        )
     contour_count = len(contours)
     if not contours:
         _save_infobox_detection_debug_images(
@@ -466,12 +614,15 @@ def find_infobox_with_debug(bgr_image: np.ndarray) -> InfoboxDetectionResult:
     )
 
 
-def find_infobox(bgr_image: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+def find_infobox(
+    bgr_image: np.ndarray,
+    reference_size: Optional[Tuple[int, int]] = None,
+) -> Optional[Tuple[int, int, int, int]]:
     """
     Backward-compatible wrapper returning only the detected infobox rectangle.
     Returns (x, y, w, h) relative to the provided image, or None if not found.
     """
-    return find_infobox_with_debug(bgr_image).rect
+    return find_infobox_with_debug(bgr_image, reference_size).rect
 
 
 def title_roi(infobox_rect: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
@@ -756,6 +907,13 @@ def find_action_bbox_by_ocr(
     return bbox, processed
 
 
+def _infobox_cache_key(processed: np.ndarray) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.array(processed.shape, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(processed).data)
+    return digest.digest()
+
+
 def ocr_infobox(infobox_bgr: np.ndarray) -> InfoboxOcrResult:
     """
     OCR the full infobox once to derive the title and action line positions.
@@ -764,8 +922,25 @@ def ocr_infobox(infobox_bgr: np.ndarray) -> InfoboxOcrResult:
     _save_debug_image("infobox_raw", infobox_bgr)
     processed = preprocess_for_ocr(infobox_bgr)
     _save_debug_image("infobox_processed", processed)
+    cache_key = _infobox_cache_key(processed)
     preprocess_time = time.perf_counter() - preprocess_start
 
+    with _infobox_ocr_cache_lock:
+        cached = _infobox_ocr_cache.get(cache_key)
+        if cached is not None:
+            _infobox_ocr_cache.move_to_end(cache_key)
+    if cached is not None:
+        item_name, raw_item_text, sell_bbox, recycle_bbox = cached
+        return InfoboxOcrResult(
+            item_name=item_name,
+            raw_item_text=raw_item_text,
+            sell_bbox=sell_bbox,
+            recycle_bbox=recycle_bbox,
+            processed=processed,
+            preprocess_time=preprocess_time,
+            ocr_time=0.0,
+        )
+
     ocr_time = 0.0
     try:
         ocr_start = time.perf_counter()
@@ -791,6 +966,16 @@ def ocr_infobox(infobox_bgr: np.ndarray) -> InfoboxOcrResult:
     item_name, raw_item_text = _extract_title_from_data(data, processed.shape[0])
     sell_bbox = _extract_action_line_bbox(data, "sell")
     recycle_bbox = _extract_action_line_bbox(data, "recycle")
+    if item_name:
+        with _infobox_ocr_cache_lock:
+            _infobox_ocr_cache[cache_key] = (
+                item_name,
+                raw_item_text,
+                sell_bbox,
+                recycle_bbox,
+            )
+            if len(_infobox_ocr_cache) > _INFOBOX_OCR_CACHE_SIZE:
+                _infobox_ocr_cache.popitem(last=False)
     return InfoboxOcrResult(
         item_name=item_name,
         raw_item_text=raw_item_text,
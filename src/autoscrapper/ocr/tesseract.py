@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import os
+import stat
 import threading
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +13,11 @@ from typing import Dict, List
 import numpy as np
 from PIL import Image
 import tessdata
+
+# Tesseract's OpenMP threading costs more than it saves on infobox-sized
+# images. OpenMP reads this when libtesseract loads, so set it before the import.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 from tesserocr import PSM, PyTessBaseAPI, RIL, iterate_level
 
 _api_lock = threading.Lock()
@@ -26,17 +34,36 @@ class OcrBackendInfo:
     languages: list[str]
 
 
+def _is_file(path: str) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
 def _has_eng(path: Path) -> bool:
-    return path.is_dir() and (path / "eng.traineddata").exists()
+    # A regular eng.traineddata implies `path` is a directory; one stat covers both.
+    return _is_file(os.path.join(path, "eng.traineddata"))
 
 
 def _candidate_tessdata_paths() -> list[Path]:
     """
     Potential tessdata locations to try, ordered by preference.
     """
+    return list(
+        _tessdata_candidates(os.getenv("TESSDATA_PREFIX"), os.getenv("APPDATA"))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _tessdata_candidates(
+    env_prefix: str | None, appdata: str | None
+) -> tuple[Path, ...]:
+    """
+    Build the tessdata search list, memoized per (TESSDATA_PREFIX, APPDATA).
+    """
     candidates: list[Path] = []
 
-    env_prefix = os.getenv("TESSDATA_PREFIX")
     if env_prefix:
         candidates.append(Path(env_prefix))
 
@@ -49,7 +76,6 @@ def _candidate_tessdata_paths() -> list[Path]:
     pkg_dir = Path(tessdata.__file__).resolve().parent
     candidates.append(pkg_dir.parent / "share" / "tessdata")
 
-    appdata = os.getenv("APPDATA")
     if appdata:
         appdata_path = Path(appdata)
         candidates.append(appdata_path / "Python" / "share" / "tessdata")
@@ -57,13 +83,7 @@ def _candidate_tessdata_paths() -> list[Path]:
         candidates.append(appdata_path / "Python" / py_ver / "share" / "tessdata")
 
     # Deduplicate while preserving order
-    seen: set[Path] = set()
-    unique: list[Path] = []
-    for c in candidates:
-        if c not in seen:
-            seen.add(c)
-            unique.append(c)
-    return unique
+    return tuple(dict.fromkeys(candidates))
 
 
 def _create_api() -> PyTessBaseAPI:
@@ -125,6 +145,22 @@ def _get_api() -> PyTessBaseAPI:
     return _api
 
 
+def _shutdown_api() -> None:
+    """
+    Release the shared Tesseract API at interpreter exit.
+    """
+    global _api
+    with _api_init_lock:
+        api, _api = _api, None
+    if api is None:
+        return
+    with _api_lock:
+        api.End()
+
+
+atexit.register(_shutdown_api)
+
+
 def initialize_ocr() -> OcrBackendInfo:
     """
     Force initialization so the OCR backend is ready before the first OCR call.
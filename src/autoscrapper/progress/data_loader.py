@@ -3,12 +3,26 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .quest_overrides import apply_quest_overrides
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 
+# Files that make up a snapshot, relative to the data directory.
+_SNAPSHOT_FILES = (
+    "items.json",
+    "quests.json",
+    "quests_graph.json",
+    "static/hideout_modules.json",
+    "static/projects.json",
+    "metadata.json",
+)
+
+_SnapshotStamp = Tuple[Optional[Tuple[int, int]], ...]
+# Last GameData per data directory, keyed by the (mtime_ns, size) of each file.
+_game_data_cache: Dict[Path, Tuple[_SnapshotStamp, "GameData"]] = {}
+
 
 @dataclass(frozen=True)
 class GameData:
@@ -24,9 +38,36 @@ def _read_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _snapshot_stamp(data_dir: Path) -> _SnapshotStamp:
+    stamps: List[Optional[Tuple[int, int]]] = []
+    for name in _SNAPSHOT_FILES:
+        try:
+            stat = (data_dir / name).stat()
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
 def load_game_data(data_dir: Optional[Path] = None) -> GameData:
+    """
+    Load the data snapshot, reusing the last parse while its files are unchanged.
+
+    The returned GameData is shared between callers and must not be mutated.
+    """
     data_dir = data_dir or DATA_DIR
+    stamp = _snapshot_stamp(data_dir)
+    cached = _game_data_cache.get(data_dir)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    game_data = _read_game_data(data_dir)
+    _game_data_cache[data_dir] = (stamp, game_data)
+    return game_data
+
 
+def _read_game_data(data_dir: Path) -> GameData:
     items_path = data_dir / "items.json"
     quests_path = data_dir / "quests.json"
     quest_graph_path = data_dir / "quests_graph.json"
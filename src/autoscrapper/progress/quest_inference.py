@@ -77,9 +77,8 @@ def _build_predecessors_by_id(
 
 
 def _build_trader_sequences(
-    quests: List[dict],
+    quests_by_trader: Dict[str, List[dict]],
 ) -> Tuple[List[str], Dict[str, List[str]]]:
-    quests_by_trader = group_quests_by_trader(quests)
     trader_order = sorted(quests_by_trader.keys())
     sequences: Dict[str, List[str]] = {}
     for trader in trader_order:
@@ -145,8 +144,9 @@ def _infer_completed_from_graph_ancestors(
     return [quest_id for quest_id in ordered_ids if quest_id in completed]
 
 
-def _resolve_active_ids(quests: List[dict], active_quests: Iterable[str]) -> Set[str]:
-    quests_by_trader = group_quests_by_trader(quests)
+def _resolve_active_ids(
+    quests_by_trader: Dict[str, List[dict]], active_quests: Iterable[str]
+) -> Set[str]:
     quest_index = build_quest_index(quests_by_trader)
     active_resolved, missing = resolve_active_quests(list(active_quests), quest_index)
     if missing:
@@ -157,8 +157,9 @@ def _resolve_active_ids(quests: List[dict], active_quests: Iterable[str]) -> Set
 def infer_completed_from_active(
     quests: List[dict], quest_graph: Dict[str, object], active_quests: Iterable[str]
 ) -> List[str]:
-    target_active = tuple(sorted(_resolve_active_ids(quests, active_quests)))
-    trader_order, trader_sequences = _build_trader_sequences(quests)
+    quests_by_trader = group_quests_by_trader(quests)
+    target_active = tuple(sorted(_resolve_active_ids(quests_by_trader, active_quests)))
+    trader_order, trader_sequences = _build_trader_sequences(quests_by_trader)
     predecessors_by_id = _build_predecessors_by_id(quests, quest_graph)
 
     trader_index_by_id: Dict[str, int] = {}
@@ -42,7 +42,14 @@ class ActionExecutionContext:
     post_action_delay: float
 
 
-def _perform_sell(
+_CONFIRM_BUTTON_CENTER = {
+    "SELL": sell_confirm_button_center,
+    "RECYCLE": recycle_confirm_button_center,
+}
+
+
+def _perform_destructive_action(
+    decision: Decision,
     infobox_rect: Tuple[int, int, int, int],
     action_bbox_rel: Tuple[int, int, int, int],
     window_left: int,
@@ -55,14 +62,17 @@ def _perform_sell(
     item_infobox_settle_delay: float = ITEM_INFOBOX_SETTLE_DELAY,
     post_action_delay: float = POST_SELL_RECYCLE_DELAY,
 ) -> None:
+    """
+    Click the SELL/RECYCLE line in the infobox, then its confirm button.
+    """
     move_duration = MOVE_DURATION * SELL_RECYCLE_SPEED_MULT
     action_pause = action_delay * SELL_RECYCLE_SPEED_MULT
     bx, by, bw, bh = action_bbox_rel
-    sell_bbox_win = (infobox_rect[0] + bx, infobox_rect[1] + by, bw, bh)
-    sx, sy = rect_center(sell_bbox_win)
+    action_bbox_win = (infobox_rect[0] + bx, infobox_rect[1] + by, bw, bh)
+    ax, ay = rect_center(action_bbox_win)
     move_window_relative(
-        sx,
-        sy,
+        ax,
+        ay,
         window_left,
         window_top,
         duration=move_duration,
@@ -70,8 +80,8 @@ def _perform_sell(
         stop_key=stop_key,
     )
     click_window_relative(
-        sx,
-        sy,
+        ax,
+        ay,
         window_left,
         window_top,
         pause=action_pause,
@@ -79,7 +89,7 @@ def _perform_sell(
     )
     sleep_with_abort(item_infobox_settle_delay, stop_key=stop_key)
 
-    cx, cy = sell_confirm_button_center(
+    cx, cy = _CONFIRM_BUTTON_CENTER[decision](
         window_left, window_top, window_width, window_height
     )
     move_absolute(
@@ -108,22 +118,8 @@ def _apply_destructive_decision(
     if not context.apply_actions:
         return f"DRY_RUN_{decision}"
 
-    if decision == "SELL":
-        _perform_sell(
-            infobox_rect,
-            action_bbox_rel,
-            context.win_left,
-            context.win_top,
-            context.win_width,
-            context.win_height,
-            stop_key=context.stop_key,
-            action_delay=context.action_delay,
-            item_infobox_settle_delay=context.item_infobox_settle_delay,
-            post_action_delay=context.post_action_delay,
-        )
-        return "SELL"
-
-    _perform_recycle(
+    _perform_destructive_action(
+        decision,
         infobox_rect,
         action_bbox_rel,
         context.win_left,
@@ -135,7 +131,7 @@ def _apply_destructive_decision(
         item_infobox_settle_delay=context.item_infobox_settle_delay,
         post_action_delay=context.post_action_delay,
     )
-    return "RECYCLE"
+    return decision
 
 
 def resolve_action_taken(
@@ -181,54 +177,3 @@ def resolve_action_taken(
             context=context,
         )
     return "SCAN_ONLY"
-
-
-def _perform_recycle(
-    infobox_rect: Tuple[int, int, int, int],
-    action_bbox_rel: Tuple[int, int, int, int],
-    window_left: int,
-    window_top: int,
-    window_width: int,
-    window_height: int,
-    *,
-    stop_key: str = DEFAULT_STOP_KEY,
-    action_delay: float = INPUT_ACTION_DELAY,
-    item_infobox_settle_delay: float = ITEM_INFOBOX_SETTLE_DELAY,
-    post_action_delay: float = POST_SELL_RECYCLE_DELAY,
-) -> None:
-    move_duration = MOVE_DURATION * SELL_RECYCLE_SPEED_MULT
-    action_pause = action_delay * SELL_RECYCLE_SPEED_MULT
-    bx, by, bw, bh = action_bbox_rel
-    recycle_bbox_win = (infobox_rect[0] + bx, infobox_rect[1] + by, bw, bh)
-    rx, ry = rect_center(recycle_bbox_win)
-    move_window_relative(
-        rx,
-        ry,
-        window_left,
-        window_top,
-        duration=move_duration,
-        pause=action_pause,
-        stop_key=stop_key,
-    )
-    click_window_relative(
-        rx,
-        ry,
-        window_left,
-        window_top,
-        pause=action_pause,
-        stop_key=stop_key,
-    )
-    sleep_with_abort(item_infobox_settle_delay, stop_key=stop_key)
-
-    cx, cy = recycle_confirm_button_center(
-        window_left, window_top, window_width, window_height
-    )
-    move_absolute(
-        cx,
-        cy,
-        duration=move_duration,
-        pause=action_pause,
-        stop_key=stop_key,
-    )
-    click_absolute(cx, cy, pause=action_pause, stop_key=stop_key)
-    sleep_with_abort(post_action_delay, stop_key=stop_key)
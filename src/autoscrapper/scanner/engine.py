@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import sys
 import time
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -28,6 +29,7 @@ from ..interaction.ui_windows import (
     WINDOW_TIMEOUT,
     abort_if_escape_pressed,
     capture_region,
+    close_capture,
     move_absolute,
     pause_action,
     wait_for_target_window,
@@ -115,6 +117,9 @@ def _build_progress_impl(
         return progress
     if not show_progress or Console is None:
         return None
+    # Live rendering is wasted work when nobody can see it (redirected output).
+    if sys.stdout is None or not sys.stdout.isatty():
+        return None
     try:
         return RichScanProgress()
     except Exception:
@@ -399,5 +404,6 @@ def scan_inventory(
 
         return run_state.results, stats
     finally:
+        close_capture()
         if progress_impl is not None:
             progress_impl.stop()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from itertools import cycle
 from typing import Any, Iterable, List, Optional, Tuple
 
+import numpy as np
+
 from .actions import ActionExecutionContext, resolve_action_taken
 from .outcomes import _describe_action
 from .progress import ScanProgress
@@ -22,11 +25,16 @@ from ..interaction.ui_windows import (
 )
 from ..ocr.inventory_vision import (
     InfoboxOcrResult,
+    are_slots_empty,
     find_infobox,
-    is_slot_empty,
     ocr_infobox,
 )
 
+# Infobox polling backs off from this delay, doubling per miss.
+_INFOBOX_POLL_INITIAL_DELAY = 0.01
+# Padding (px) around the predicted infobox region when capturing only that ROI.
+_INFOBOX_ROI_MARGIN = 48
+
 
 @dataclass(frozen=True)
 class TimingConfig:
@@ -63,6 +71,9 @@ class _InfoboxCaptureResult:
     find_time: float
     capture_attempts: int
     found_on_attempt: int
+    # Window-relative (x, y) of window_bgr's top-left pixel; non-zero when
+    # only the predicted infobox region was captured.
+    frame_origin: Tuple[int, int] = (0, 0)
 
 
 @dataclass(frozen=True)
@@ -74,6 +85,8 @@ class _InfoboxReadResult:
     recycle_bbox_rel: Optional[Tuple[int, int, int, int]]
     preprocess_time: float
     ocr_time: float
+    # True when the next cell's infobox was opened while OCR ran.
+    next_cell_opened: bool = False
 
 
 @dataclass(frozen=True)
@@ -82,6 +95,7 @@ class _CellScanResult:
     action_label: str
     item_label: str
     action_taken: str
+    next_cell_opened: bool = False
 
 
 @dataclass
@@ -129,21 +143,27 @@ def detect_grid(
     context: ScanContext,
     progress_impl: Optional[ScanProgress],
     startup_events: List[Tuple[str, str]],
+    window_bgr: Optional[np.ndarray] = None,
 ) -> Grid:
     """
     Move the cursor out of the grid, capture the ROI, and detect cells.
+
+    When `window_bgr` (a full-window frame taken with the cursor parked) is
+    given, the ROI is cropped from it instead of being captured again.
     """
-    move_absolute(
-        context.safe_point_abs[0],
-        context.safe_point_abs[1],
-        stop_key=context.stop_key,
-    )
-    pause_action(context.timing.input_action_delay, stop_key=context.stop_key)
-    roi_left = context.win_left + context.grid_roi[0]
-    roi_top = context.win_top + context.grid_roi[1]
-    inv_bgr = capture_region(
-        (roi_left, roi_top, context.grid_roi[2], context.grid_roi[3])
-    )
+    roi_x, roi_y, roi_w, roi_h = context.grid_roi
+    if window_bgr is not None:
+        inv_bgr = window_bgr[roi_y : roi_y + roi_h, roi_x : roi_x + roi_w]
+    else:
+        move_absolute(
+            context.safe_point_abs[0],
+            context.safe_point_abs[1],
+            stop_key=context.stop_key,
+        )
+        pause_action(context.timing.input_action_delay, stop_key=context.stop_key)
+        inv_bgr = capture_region(
+            (context.win_left + roi_x, context.win_top + roi_y, roi_w, roi_h)
+        )
     grid = Grid.detect(inv_bgr, context.grid_roi, context.win_width, context.win_height)
     expected_cells = Grid.COLS * Grid.ROWS
     if len(grid) < expected_cells:
@@ -161,39 +181,22 @@ def _detect_consecutive_empty_stop_idx(
     page: int,
     cells: List[Cell],
     cells_per_page: int,
-    window_left: int,
-    window_top: int,
-    window_width: int,
-    window_height: int,
-    safe_point_abs: Tuple[int, int],
+    window_bgr: np.ndarray,
     stop_key: str,
-    action_delay: float,
 ) -> Optional[int]:
     """
-    Capture the current page and return the global index of the *second* empty cell
-    in the first run of two consecutive empty cells (row-major order).
+    Return the global index of the *second* empty cell in the first run of two
+    consecutive empty cells (row-major order) on the captured page.
 
     This is a pragmatic compromise: a single empty cell can be a transient gap
     (e.g., during item removal/collapse), but two empties in a row is a strong
     signal that we've reached the end of items.
     """
+    empty_flags = are_slots_empty(window_bgr, [cell.safe_rect for cell in cells])
     abort_if_escape_pressed(stop_key)
 
-    # Keep the cursor out of the grid so it doesn't occlude cells.
-    move_absolute(safe_point_abs[0], safe_point_abs[1], stop_key=stop_key)
-    pause_action(action_delay, stop_key=stop_key)
-
-    window_bgr = capture_region((window_left, window_top, window_width, window_height))
-
     prev_empty = False
-    for cell in cells:
-        abort_if_escape_pressed(stop_key)
-        x, y, w, h = cell.safe_rect
-        slot_bgr = window_bgr[y : y + h, x : x + w]
-        if slot_bgr.size == 0:
-            prev_empty = False
-            continue
-        is_empty = is_slot_empty(slot_bgr)
+    for cell, is_empty in zip(cells, empty_flags):
         if is_empty and prev_empty:
             return page * cells_per_page + cell.index
         prev_empty = is_empty
@@ -230,16 +233,43 @@ class _ScanRunner:
             item_infobox_settle_delay=context.timing.item_infobox_settle_delay,
             post_action_delay=context.timing.post_sell_recycle_delay,
         )
+        # Loop invariants hoisted out of the per-cell path.
+        self._window_region = (
+            context.win_left,
+            context.win_top,
+            context.win_width,
+            context.win_height,
+        )
+        self._window_has_is_alive = context.window is not None and hasattr(
+            context.window, "isAlive"
+        )
+        # Reused for every full-window capture; each frame is consumed before
+        # the next capture overwrites it.
+        self._window_buf = np.empty(
+            (context.win_height, context.win_width, 3), dtype=np.uint8
+        )
+        # Last infobox placement relative to its cell: (dx, dy, w, h).
+        self._infobox_cell_offset: Optional[Tuple[int, int, int, int]] = None
+        # Single worker so OCR can overlap the post-capture input pause; input
+        # and capture stay on the scan thread.
+        self._ocr_executor: Optional[ThreadPoolExecutor] = None
 
     def run(self) -> ScanRunState:
-        for page in range(self.config.pages_to_scan):
-            page_base_idx = page * self.context.cells_per_page
-            if (
-                self.state.stop_at_global_idx is not None
-                and page_base_idx >= self.state.stop_at_global_idx
-            ):
-                break
-            self._scan_single_page(page)
+        self._ocr_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="infobox-ocr"
+        )
+        try:
+            for page in range(self.config.pages_to_scan):
+                page_base_idx = page * self.context.cells_per_page
+                if (
+                    self.state.stop_at_global_idx is not None
+                    and page_base_idx >= self.state.stop_at_global_idx
+                ):
+                    break
+                self._scan_single_page(page)
+        finally:
+            self._ocr_executor.shutdown(wait=True)
+            self._ocr_executor = None
 
         return self.state
 
@@ -274,27 +304,92 @@ class _ScanRunner:
             left_right_click_gap=self.context.timing.cell_infobox_left_right_click_gap,
         )
 
-    def _capture_infobox_with_retries(self) -> _InfoboxCaptureResult:
+    def _predicted_infobox_region(
+        self, cell: Cell
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Window-relative region likely to contain the infobox for `cell`.
+        """
+        if self._infobox_cell_offset is None:
+            return None
+        dx, dy, w, h = self._infobox_cell_offset
+        x0 = max(0, cell.x + dx - _INFOBOX_ROI_MARGIN)
+        y0 = max(0, cell.y + dy - _INFOBOX_ROI_MARGIN)
+        x1 = min(self.context.win_width, cell.x + dx + w + _INFOBOX_ROI_MARGIN)
+        y1 = min(self.context.win_height, cell.y + dy + h + _INFOBOX_ROI_MARGIN)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1 - x0, y1 - y0
+
+    def _find_infobox_in_region(
+        self, region: Tuple[int, int, int, int]
+    ) -> Tuple[Optional[Tuple[int, int, int, int]], Any, float, float]:
+        """
+        Capture only `region` and look for a complete infobox inside it.
+        """
+        rx, ry, rw, rh = region
+        capture_start = time.perf_counter()
+        frame = capture_region(
+            (self.context.win_left + rx, self.context.win_top + ry, rw, rh)
+        )
+        capture_time = time.perf_counter() - capture_start
+
+        find_start = time.perf_counter()
+        # The crop must not change detection parameters: size the morphology
+        # from the full window, as the full-window fallback does.
+        rect = find_infobox(frame, (self.context.win_width, self.context.win_height))
+        find_time = time.perf_counter() - find_start
+
+        if rect is None:
+            return None, frame, capture_time, find_time
+        x, y, w, h = rect
+        # A box clipped by the region edge may be truncated; let the caller
+        # fall back to a full-window capture.
+        if x <= 0 or y <= 0 or x + w >= rw or y + h >= rh:
+            return None, frame, capture_time, find_time
+        return (rx + x, ry + y, w, h), frame, capture_time, find_time
+
+    def _capture_infobox_with_retries(self, cell: Cell) -> _InfoboxCaptureResult:
         infobox_rect: Optional[Tuple[int, int, int, int]] = None
         window_bgr = None
+        frame_origin = (0, 0)
         capture_time = 0.0
         find_time = 0.0
         capture_attempts = 0
         found_on_attempt = 0
+        predicted_region = self._predicted_infobox_region(cell)
+
+        # Poll until the infobox shows up instead of sleeping a fixed interval
+        # per miss. The budget covers the old retry schedule plus the fixed
+        # pre-capture pause it replaces.
+        timing = self.context.timing
+        deadline = (
+            time.perf_counter()
+            + timing.input_action_delay
+            + self.config.infobox_retries
+            * (timing.infobox_retry_interval + timing.input_action_delay)
+        )
+        poll_delay = _INFOBOX_POLL_INITIAL_DELAY
 
-        for attempt in range(1, self.config.infobox_retries + 1):
+        while True:
             capture_attempts += 1
             abort_if_escape_pressed(self.context.stop_key)
 
-            capture_start = time.perf_counter()
-            window_bgr = capture_region(
-                (
-                    self.context.win_left,
-                    self.context.win_top,
-                    self.context.win_width,
-                    self.context.win_height,
+            if predicted_region is not None:
+                infobox_rect, window_bgr, roi_capture, roi_find = (
+                    self._find_infobox_in_region(predicted_region)
                 )
-            )
+                capture_time += roi_capture
+                find_time += roi_find
+                if infobox_rect:
+                    frame_origin = predicted_region[:2]
+                    found_on_attempt = capture_attempts
+                    break
+                # The prediction missed; use full-window captures from here on.
+                predicted_region = None
+
+            capture_start = time.perf_counter()
+            window_bgr = capture_region(self._window_region, out=self._window_buf)
             capture_time += time.perf_counter() - capture_start
 
             find_start = time.perf_counter()
@@ -302,17 +397,21 @@ class _ScanRunner:
             find_time += time.perf_counter() - find_start
 
             if infobox_rect:
-                found_on_attempt = attempt
+                found_on_attempt = capture_attempts
                 break
 
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
             sleep_with_abort(
-                self.context.timing.infobox_retry_interval,
-                stop_key=self.context.stop_key,
-            )
-            pause_action(
-                self.context.timing.input_action_delay,
+                min(poll_delay, remaining),
                 stop_key=self.context.stop_key,
             )
+            poll_delay *= 2
+
+        if infobox_rect:
+            x, y, w, h = infobox_rect
+            self._infobox_cell_offset = (x - cell.x, y - cell.y, w, h)
 
         return _InfoboxCaptureResult(
             infobox_rect=infobox_rect,
@@ -321,11 +420,14 @@ class _ScanRunner:
             find_time=find_time,
             capture_attempts=capture_attempts,
             found_on_attempt=found_on_attempt,
+            frame_origin=frame_origin,
         )
 
     def _ocr_infobox_with_retries(
         self,
         capture_result: _InfoboxCaptureResult,
+        cell: Cell,
+        next_cell: Optional[Cell] = None,
     ) -> _InfoboxReadResult:
         infobox_rect = capture_result.infobox_rect
         window_bgr = capture_result.window_bgr
@@ -349,14 +451,41 @@ class _ScanRunner:
                 ocr_time=ocr_time,
             )
 
-        pause_action(
-            self.context.timing.input_action_delay,
-            stop_key=self.context.stop_key,
-        )
         x, y, w, h = infobox_rect
+        ox, oy = capture_result.frame_origin
+        first_bgr = window_bgr[y - oy : y - oy + h, x - ox : x - ox + w]
+
+        # Start OCR on the captured frame while the input pause elapses, or
+        # while the next cell is opened when no action depends on this one.
+        first_ocr = None
+        next_cell_opened = False
+        if self._ocr_executor is not None:
+            first_ocr = self._ocr_executor.submit(ocr_infobox, first_bgr)
+        if first_ocr is not None and next_cell is not None:
+            self._open_cell_infobox(next_cell)
+            next_cell_opened = True
+        else:
+            pause_action(
+                self.context.timing.input_action_delay,
+                stop_key=self.context.stop_key,
+            )
 
         for ocr_attempt in range(self.config.ocr_unreadable_retries + 1):
-            if ocr_attempt > 0:
+            if ocr_attempt == 0:
+                infobox_ocr = (
+                    first_ocr.result()
+                    if first_ocr is not None
+                    else ocr_infobox(first_bgr)
+                )
+            else:
+                if next_cell_opened:
+                    # Unreadable after moving on; bring this cell's infobox back.
+                    self._open_cell_infobox(cell)
+                    next_cell_opened = False
+                    sleep_with_abort(
+                        self.context.timing.item_infobox_settle_delay,
+                        stop_key=self.context.stop_key,
+                    )
                 sleep_with_abort(
                     self.context.timing.ocr_retry_interval,
                     stop_key=self.context.stop_key,
@@ -367,18 +496,11 @@ class _ScanRunner:
                     )
                 except Exception:
                     window_bgr = capture_region(
-                        (
-                            self.context.win_left,
-                            self.context.win_top,
-                            self.context.win_width,
-                            self.context.win_height,
-                        )
+                        self._window_region, out=self._window_buf
                     )
                     infobox_bgr = window_bgr[y : y + h, x : x + w]
-            else:
-                infobox_bgr = window_bgr[y : y + h, x : x + w]
+                infobox_ocr = ocr_infobox(infobox_bgr)
 
-            infobox_ocr = ocr_infobox(infobox_bgr)
             preprocess_time += infobox_ocr.preprocess_time
             ocr_time += infobox_ocr.ocr_time
             item_name = infobox_ocr.item_name
@@ -396,28 +518,32 @@ class _ScanRunner:
             recycle_bbox_rel=recycle_bbox_rel,
             preprocess_time=preprocess_time,
             ocr_time=ocr_time,
+            next_cell_opened=next_cell_opened,
         )
 
-    def _process_cell(self, *, page: int, cell: Cell) -> _CellScanResult:
-        global_idx = page * self.context.cells_per_page + cell.index
+    def _process_cell(
+        self,
+        *,
+        page: int,
+        cell: Cell,
+        global_idx: int,
+        next_cell: Optional[Cell] = None,
+    ) -> _CellScanResult:
         cell_start = time.perf_counter()
 
         abort_if_escape_pressed(self.context.stop_key)
-        window = self.context.window
-        if window is not None and hasattr(window, "isAlive") and not window.isAlive:  # type: ignore[attr-defined]
+        if self._window_has_is_alive and not self.context.window.isAlive:  # type: ignore[union-attr]
             raise RuntimeError("Target window closed during scan")
 
+        # The settle delay keeps the previous cell's infobox from being read;
+        # any further wait is spent polling for the new one.
         sleep_with_abort(
             self.context.timing.item_infobox_settle_delay,
             stop_key=self.context.stop_key,
         )
-        pause_action(
-            self.context.timing.input_action_delay,
-            stop_key=self.context.stop_key,
-        )
 
-        capture_result = self._capture_infobox_with_retries()
-        ocr_result = self._ocr_infobox_with_retries(capture_result)
+        capture_result = self._capture_infobox_with_retries(cell)
+        ocr_result = self._ocr_infobox_with_retries(capture_result, cell, next_cell)
 
         decision: Optional[Decision] = None
         decision_note: Optional[str] = None
@@ -473,6 +599,7 @@ class _ScanRunner:
             action_label=action_label,
             item_label=item_label,
             action_taken=action_taken,
+            next_cell_opened=ocr_result.next_cell_opened,
         )
 
     def _record_processed_cell(
@@ -500,20 +627,32 @@ class _ScanRunner:
             cell_scan.action_label,
         )
 
+    def _capture_page(self) -> np.ndarray:
+        """
+        Park the cursor outside the grid and capture the whole window.
+        """
+        abort_if_escape_pressed(self.context.stop_key)
+        # Keep the cursor out of the grid so it doesn't occlude cells.
+        move_absolute(
+            self.context.safe_point_abs[0],
+            self.context.safe_point_abs[1],
+            stop_key=self.context.stop_key,
+        )
+        pause_action(
+            self.context.timing.input_action_delay,
+            stop_key=self.context.stop_key,
+        )
+        return capture_region(self._window_region, out=self._window_buf)
+
     def _update_stop_from_empty_detection(
-        self, *, page: int, cells: List[Cell]
+        self, *, page: int, cells: List[Cell], window_bgr: np.ndarray
     ) -> None:
         empty_idx = _detect_consecutive_empty_stop_idx(
             page,
             cells,
             self.context.cells_per_page,
-            self.context.win_left,
-            self.context.win_top,
-            self.context.win_width,
-            self.context.win_height,
-            self.context.safe_point_abs,
+            window_bgr,
             self.context.stop_key,
-            self.context.timing.input_action_delay,
         )
         if empty_idx is None:
             return
@@ -537,17 +676,42 @@ class _ScanRunner:
         if not cells:
             return
 
+        page_base_idx = page * self.context.cells_per_page
+        cell_count = len(cells)
+        # The stop index is fixed before the page is scanned, so cut the page
+        # once instead of re-checking it for every cell.
+        stop_pos = cell_count
+        stop_at_global_idx = self.state.stop_at_global_idx
+        if stop_at_global_idx is not None:
+            stop_pos = next(
+                (
+                    pos
+                    for pos, cell in enumerate(cells)
+                    if page_base_idx + cell.index >= stop_at_global_idx
+                ),
+                cell_count,
+            )
+
+        # Without a possible SELL/RECYCLE no cell needs its infobox after OCR
+        # starts, so the next cell can be opened while OCR runs.
+        prefetch_next = not (self.context.apply_actions and self.context.actions)
+
         idx_in_page = 0
-        self._open_cell_infobox(cells[0])
+        if stop_pos > 0:
+            self._open_cell_infobox(cells[0])
 
-        while idx_in_page < len(cells):
+        while idx_in_page < stop_pos:
             cell = cells[idx_in_page]
-            global_idx = page * self.context.cells_per_page + cell.index
-
-            if self._should_stop_at_index(global_idx):
-                break
+            global_idx = page_base_idx + cell.index
+            next_cell = (
+                cells[idx_in_page + 1]
+                if prefetch_next and idx_in_page + 1 < stop_pos
+                else None
+            )
 
-            cell_scan = self._process_cell(page=page, cell=cell)
+            cell_scan = self._process_cell(
+                page=page, cell=cell, global_idx=global_idx, next_cell=next_cell
+            )
             self._record_processed_cell(page=page, cell=cell, cell_scan=cell_scan)
 
             destructive_action = cell_scan.action_taken in {"SELL", "RECYCLE"}
@@ -557,14 +721,12 @@ class _ScanRunner:
                 continue
 
             idx_in_page += 1
-            if idx_in_page < len(cells):
-                next_global_idx = (
-                    page * self.context.cells_per_page + cells[idx_in_page].index
-                )
-                if self._should_stop_at_index(next_global_idx):
-                    break
+            if idx_in_page < stop_pos and not cell_scan.next_cell_opened:
                 self._open_cell_infobox(cells[idx_in_page])
 
+        if stop_pos < cell_count:
+            self._should_stop_at_index(page_base_idx + cells[stop_pos].index)
+
     def _scan_single_page(self, page: int) -> None:
         self.state.pages_scanned += 1
 
@@ -578,10 +740,21 @@ class _ScanRunner:
                 stop_key=self.context.stop_key,
                 pause=self.context.timing.input_action_delay,
             )
-            grid = detect_grid(self.context, self.progress_impl, self.startup_events)
+        # One parked capture per page feeds both grid detection and the
+        # empty-slot check.
+        window_bgr = self._capture_page()
+        if page > 0:
+            grid = detect_grid(
+                self.context,
+                self.progress_impl,
+                self.startup_events,
+                window_bgr=window_bgr,
+            )
             cells = list(grid)
 
-        self._update_stop_from_empty_detection(page=page, cells=cells)
+        self._update_stop_from_empty_detection(
+            page=page, cells=cells, window_bgr=window_bgr
+        )
         self._scan_cells_on_page(page=page, cells=cells)
 
 
@@ -57,6 +57,119 @@ class MenuItem:
     disabled: bool = False
 
 
+# Menu entries only depend on the screen they are invoked from, so they are
+# built once at import instead of on every menu construction.
+_HOME_MENU_ITEMS: tuple[MenuItem, ...] = (
+    MenuItem(
+        "1",
+        "Scan",
+        lambda screen: screen.app.push_screen(screen.app._scan_menu()),
+    ),
+    MenuItem(
+        "2",
+        "Generate Personalized Rule List (Quests / Workshop Level)",
+        lambda screen: screen.app.push_screen(screen.app._progress_menu()),
+    ),
+    MenuItem(
+        "3",
+        "Review Rules",
+        lambda screen: screen.app.push_screen(RulesScreen()),
+    ),
+    MenuItem(
+        "4",
+        "Settings",
+        lambda screen: screen.app.push_screen(screen.app._settings_menu()),
+    ),
+    MenuItem(
+        "5",
+        "Maintenance",
+        lambda screen: screen.app.push_screen(screen.app._maintenance_menu()),
+    ),
+    MenuItem("q", "Quit", lambda screen: screen.app.exit()),
+)
+
+_SCAN_MENU_ITEMS: tuple[MenuItem, ...] = (
+    MenuItem(
+        "1",
+        "Scan now",
+        lambda screen: screen.app.push_screen(ScanScreen(dry_run=False)),
+    ),
+    MenuItem(
+        "2",
+        "Dry run (no clicks)",
+        lambda screen: screen.app.push_screen(ScanScreen(dry_run=True)),
+    ),
+    MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
+)
+
+_PROGRESS_MENU_ITEMS: tuple[MenuItem, ...] = (
+    MenuItem(
+        "1",
+        "Set up / update progress",
+        lambda screen: launch_progress_wizard(screen.app),
+    ),
+    MenuItem(
+        "2",
+        "Review completed quests",
+        lambda screen: launch_review_quests(screen.app),
+    ),
+    MenuItem(
+        "3",
+        "Edit workshop levels",
+        lambda screen: launch_edit_workshops(screen.app),
+    ),
+    MenuItem(
+        "4",
+        "Update rules from saved progress",
+        lambda screen: launch_generate_rules(screen.app),
+    ),
+    MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
+)
+
+_SETTINGS_MENU_ITEMS: tuple[MenuItem, ...] = (
+    MenuItem(
+        "1",
+        "Keyboard + scrolling",
+        lambda screen: screen.app.push_screen(ScanControlsScreen()),
+    ),
+    MenuItem(
+        "2",
+        "Detection + OCR retries",
+        lambda screen: screen.app.push_screen(ScanDetectionScreen()),
+    ),
+    MenuItem(
+        "3",
+        "Scan pacing + delays",
+        lambda screen: screen.app.push_screen(ScanTimingScreen()),
+    ),
+    MenuItem(
+        "4",
+        "Diagnostics",
+        lambda screen: screen.app.push_screen(ScanDiagnosticsScreen()),
+    ),
+    MenuItem(
+        "5",
+        "Reset scan settings to defaults",
+        lambda screen: screen.app.push_screen(ResetScanSettingsScreen()),
+    ),
+    MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
+)
+
+_MAINTENANCE_MENU_ITEMS: tuple[MenuItem, ...] = (
+    MenuItem(
+        "1",
+        "Reset saved progress",
+        lambda screen: screen.app.push_screen(ResetProgressScreen()),
+    ),
+    MenuItem(
+        "2",
+        "Reset rules to default",
+        lambda screen: screen.app.push_screen(ResetRulesScreen()),
+    ),
+    MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
+)
+
+
 class StatusPanel(Static):
     def refresh_status(self) -> None:
         self.update(build_status_panel())
@@ -194,6 +307,7 @@ class MenuScreen(AppScreen):
         self.show_status = show_status
         self._actions: dict[str, MenuItem] = {}
         self._keys: list[str] = []
+        self._rendered_menu: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="menu-root"):
@@ -219,10 +333,18 @@ class MenuScreen(AppScreen):
         menu.focus()
 
     def _render_menu(self) -> None:
-        self._actions = {item.key: item for item in self.items if not item.disabled}
-        self._keys = [item.key for item in self.items]
-        menu = self.query_one(OptionList)
-        menu.set_options([self._build_option(item) for item in self.items])
+        # Options only change with the items or the recommended entry; resuming
+        # the screen just restores the default highlight.
+        rendered = (
+            self.recommended_key,
+            tuple((item.key, item.label, item.disabled) for item in self.items),
+        )
+        if rendered != self._rendered_menu:
+            self._actions = {item.key: item for item in self.items if not item.disabled}
+            self._keys = [item.key for item in self.items]
+            menu = self.query_one(OptionList)
+            menu.set_options([self._build_option(item) for item in self.items])
+            self._rendered_menu = rendered
         self._highlight_default()
 
     def _build_option(self, item: MenuItem) -> Option:
@@ -286,36 +408,11 @@ class HomeScreen(MenuScreen):
 
     def _refresh_items(self) -> None:
         recommended = "2" if not has_progress() else "1"
+        if self.items and recommended == self.recommended_key:
+            return
         self.default_key = recommended
         self.recommended_key = recommended
-        self.items = [
-            MenuItem(
-                "1",
-                "Scan",
-                lambda screen: screen.app.push_screen(screen.app._scan_menu()),
-            ),
-            MenuItem(
-                "2",
-                "Generate Personalized Rule List (Quests / Workshop Level)",
-                lambda screen: screen.app.push_screen(screen.app._progress_menu()),
-            ),
-            MenuItem(
-                "3",
-                "Review Rules",
-                lambda screen: screen.app.push_screen(RulesScreen()),
-            ),
-            MenuItem(
-                "4",
-                "Settings",
-                lambda screen: screen.app.push_screen(screen.app._settings_menu()),
-            ),
-            MenuItem(
-                "5",
-                "Maintenance",
-                lambda screen: screen.app.push_screen(screen.app._maintenance_menu()),
-            ),
-            MenuItem("q", "Quit", lambda screen: screen.app.exit()),
-        ]
+        self.items = list(_HOME_MENU_ITEMS)
 
     def on_mount(self) -> None:
         self._refresh_items()
@@ -332,20 +429,7 @@ class HomeScreen(MenuScreen):
 
 class MaintenanceMenuScreen(MenuScreen):
     def __init__(self) -> None:
-        items = [
-            MenuItem(
-                "1",
-                "Reset saved progress",
-                lambda screen: screen.app.push_screen(ResetProgressScreen()),
-            ),
-            MenuItem(
-                "2",
-                "Reset rules to default",
-                lambda screen: screen.app.push_screen(ResetRulesScreen()),
-            ),
-            MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
-        ]
-        super().__init__("Maintenance", items, default_key="1")
+        super().__init__("Maintenance", _MAINTENANCE_MENU_ITEMS, default_key="1")
 
 
 class AutoScrapperApp(App[None]):
@@ -383,77 +467,13 @@ class AutoScrapperApp(App[None]):
         self.pop_screen()
 
     def _scan_menu(self) -> MenuScreen:
-        items = [
-            MenuItem(
-                "1",
-                "Scan now",
-                lambda screen: screen.app.push_screen(ScanScreen(dry_run=False)),
-            ),
-            MenuItem(
-                "2",
-                "Dry run (no clicks)",
-                lambda screen: screen.app.push_screen(ScanScreen(dry_run=True)),
-            ),
-            MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
-        ]
-        return MenuScreen("Scan", items, default_key="1")
+        return MenuScreen("Scan", _SCAN_MENU_ITEMS, default_key="1")
 
     def _progress_menu(self) -> MenuScreen:
-        items = [
-            MenuItem(
-                "1",
-                "Set up / update progress",
-                lambda screen: launch_progress_wizard(screen.app),
-            ),
-            MenuItem(
-                "2",
-                "Review completed quests",
-                lambda screen: launch_review_quests(screen.app),
-            ),
-            MenuItem(
-                "3",
-                "Edit workshop levels",
-                lambda screen: launch_edit_workshops(screen.app),
-            ),
-            MenuItem(
-                "4",
-                "Update rules from saved progress",
-                lambda screen: launch_generate_rules(screen.app),
-            ),
-            MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
-        ]
-        return MenuScreen("Progress", items, default_key="1")
+        return MenuScreen("Progress", _PROGRESS_MENU_ITEMS, default_key="1")
 
     def _settings_menu(self) -> MenuScreen:
-        items = [
-            MenuItem(
-                "1",
-                "Keyboard + scrolling",
-                lambda screen: screen.app.push_screen(ScanControlsScreen()),
-            ),
-            MenuItem(
-                "2",
-                "Detection + OCR retries",
-                lambda screen: screen.app.push_screen(ScanDetectionScreen()),
-            ),
-            MenuItem(
-                "3",
-                "Scan pacing + delays",
-                lambda screen: screen.app.push_screen(ScanTimingScreen()),
-            ),
-            MenuItem(
-                "4",
-                "Diagnostics",
-                lambda screen: screen.app.push_screen(ScanDiagnosticsScreen()),
-            ),
-            MenuItem(
-                "5",
-                "Reset scan settings to defaults",
-                lambda screen: screen.app.push_screen(ResetScanSettingsScreen()),
-            ),
-            MenuItem("0", "Back", lambda screen: screen.app.pop_screen()),
-        ]
-        return MenuScreen("Settings", items, default_key="1")
+        return MenuScreen("Settings", _SETTINGS_MENU_ITEMS, default_key="1")
 
     def _maintenance_menu(self) -> MenuScreen:
         return MaintenanceMenuScreen()
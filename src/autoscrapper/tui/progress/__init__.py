@@ -28,6 +28,7 @@ from .state import (
     build_quest_entries,
     build_wizard_state,
     compute_completed_quests,
+    filter_quest_entries,
     normalize_quest_value,
     persist_progress_settings,
     save_workshop_levels,
@@ -229,20 +230,7 @@ class ActiveQuestsScreen(ProgressScreen):
         entries = self._sorted_entries()
         if not self.search_query:
             return entries
-        normalized = normalize_quest_value(self.search_query)
-        if not normalized:
-            return entries
-        results: List[QuestEntry] = []
-        for entry in entries:
-            name_norm = normalize_quest_value(entry.name)
-            trader_norm = normalize_quest_value(entry.trader)
-            if (
-                normalized in name_norm
-                or normalized in trader_norm
-                or normalized == entry.id
-            ):
-                results.append(entry)
-        return results
+        return filter_quest_entries(entries, self.search_query)
 
     def _option_label(self, entry: QuestEntry, list_index: int) -> Text:
         selected = entry.id in self.state.active_ids
@@ -289,6 +277,9 @@ class ActiveQuestsScreen(ProgressScreen):
             f"Showing {len(self.filtered)} of {len(self.state.quest_entries)} • "
             f"Sort: {sort_label} • Filter: {filter_text}"
         )
+        self._refresh_count()
+
+    def _refresh_count(self) -> None:
         count_text = (
             f"Selected: {len(self.state.active_ids)} • "
             f"Showing: {len(self.filtered)} • "
@@ -310,12 +301,15 @@ class ActiveQuestsScreen(ProgressScreen):
         menu = self.query_one("#quest-list", OptionList)
         if not self.filtered or menu.highlighted is None:
             return
-        entry = self.filtered[menu.highlighted]
+        index = menu.highlighted
+        entry = self.filtered[index]
         if entry.id in self.state.active_ids:
             self.state.active_ids.remove(entry.id)
         else:
             self.state.active_ids.add(entry.id)
-        self._refresh_options()
+        # Selection does not affect filtering or order; only this row changes.
+        menu.replace_option_prompt(entry.id, self._option_label(entry, index))
+        self._refresh_count()
 
     def action_cursor_up(self) -> None:
         self._move_highlight(-1)
@@ -465,6 +459,14 @@ class WorkshopLevelsScreen(ProgressScreen):
         count_text = f"Workshops set: {len(self.levels)}"
         self.query_one("#workshop-count", Static).update(count_text)
 
+    def _update_level(self, entry: HideoutModule, value: int) -> None:
+        # Holding an arrow key repeats this; only the changed row is redrawn.
+        if self.levels.get(entry.id, 0) == value:
+            return
+        self.levels[entry.id] = value
+        menu = self.query_one("#workshop-list", OptionList)
+        menu.replace_option_prompt(entry.id, self._option_label(entry))
+
     def _adjust_selected(self, delta: int) -> None:
         menu = self.query_one("#workshop-list", OptionList)
         if menu.highlighted is None:
@@ -472,8 +474,7 @@ class WorkshopLevelsScreen(ProgressScreen):
         entry = self.entries[menu.highlighted]
         current = self.levels.get(entry.id, 0)
         new_value = max(0, min(entry.max_level, current + delta))
-        self.levels[entry.id] = new_value
-        self._refresh_options()
+        self._update_level(entry, new_value)
 
     def _set_selected(self, value: int) -> None:
         menu = self.query_one("#workshop-list", OptionList)
@@ -481,8 +482,7 @@ class WorkshopLevelsScreen(ProgressScreen):
             return
         entry = self.entries[menu.highlighted]
         if 0 <= value <= entry.max_level:
-            self.levels[entry.id] = value
-            self._refresh_options()
+            self._update_level(entry, value)
 
     def on_key(self, event: events.Key) -> None:
         if event.key == "left":
@@ -499,8 +499,7 @@ class WorkshopLevelsScreen(ProgressScreen):
             if menu.highlighted is None:
                 return
             entry = self.entries[menu.highlighted]
-            self.levels[entry.id] = entry.max_level
-            self._refresh_options()
+            self._update_level(entry, entry.max_level)
             event.stop()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
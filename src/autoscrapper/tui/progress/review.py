@@ -13,7 +13,17 @@ from textual.widgets.option_list import Option
 from ...config import ProgressSettings
 from ..common import MessageScreen, update_inline_filter
 from .base import ProgressScreen
-from .state import QuestEntry, normalize_quest_value, persist_progress_settings
+from .state import (
+    QuestEntry,
+    filter_quest_entries,
+    normalize_quest_value,
+    persist_progress_settings,
+)
+
+# Shared status markers; labels only copy them via append_text, never mutate.
+_STATUS_DONE = Text("✓", style="green")
+_STATUS_ACTIVE = Text("A", style="cyan")
+_STATUS_NONE = Text("·", style="dim")
 
 
 class ReviewQuestsScreen(ProgressScreen):
@@ -150,27 +160,24 @@ class ReviewQuestsScreen(ProgressScreen):
         entries = self._sorted_entries()
         if not self.search_query:
             return entries
-        normalized = normalize_quest_value(self.search_query)
-        if not normalized:
-            return entries
-        matches: List[QuestEntry] = []
-        for entry in entries:
-            name_norm = normalize_quest_value(entry.name)
-            trader_norm = normalize_quest_value(entry.trader)
-            if (
-                normalized in name_norm
-                or normalized in trader_norm
-                or normalized == entry.id
-            ):
-                matches.append(entry)
-        return matches
+        return filter_quest_entries(entries, self.search_query)
 
     def _status_label(self, entry: QuestEntry) -> Text:
         if entry.id in self.completed:
-            return Text("✓", style="green")
+            return _STATUS_DONE
         if entry.id in self.active_read_only:
-            return Text("A", style="cyan")
-        return Text("·", style="dim")
+            return _STATUS_ACTIVE
+        return _STATUS_NONE
+
+    def _option_label(self, entry: QuestEntry, list_index: int) -> Text:
+        label = Text()
+        label.append(f"{list_index + 1:>3} ", style="dim")
+        label.append_text(self._status_label(entry))
+        label.append(" ")
+        label.append(entry.name, style="bold")
+        label.append("  ")
+        label.append(entry.trader, style="dim")
+        return label
 
     def _refresh(self) -> None:
         menu = self.query_one("#review-list", OptionList)
@@ -181,16 +188,10 @@ class ReviewQuestsScreen(ProgressScreen):
             prev_id = prev_filtered[prev_highlight].id
 
         self.filtered = self._visible_entries()
-        options: List[Option] = []
-        for list_index, entry in enumerate(self.filtered):
-            label = Text()
-            label.append(f"{list_index + 1:>3} ", style="dim")
-            label.append_text(self._status_label(entry))
-            label.append(" ")
-            label.append(entry.name, style="bold")
-            label.append("  ")
-            label.append(entry.trader, style="dim")
-            options.append(Option(label, id=entry.id))
+        options: List[Option] = [
+            Option(self._option_label(entry, list_index), id=entry.id)
+            for list_index, entry in enumerate(self.filtered)
+        ]
         had_focus = menu.has_focus
         menu.set_options(options)
         if options:
@@ -213,6 +214,9 @@ class ReviewQuestsScreen(ProgressScreen):
             f"Showing {len(self.filtered)} of {len(self.quest_entries)} • "
             f"Sort: {sort_label} • Filter: {filter_text}"
         )
+        self._refresh_count()
+
+    def _refresh_count(self) -> None:
         count_text = (
             f"Completed: {len(self.completed)} • "
             f"Active (read-only): {len(self.active_read_only)} • "
@@ -254,7 +258,12 @@ class ReviewQuestsScreen(ProgressScreen):
                 )
                 return
             self.completed.add(entry.id)
-        self._refresh()
+        # Completion does not affect filtering or order; only this row changes.
+        menu = self.query_one("#review-list", OptionList)
+        menu.replace_option_prompt(
+            entry.id, self._option_label(entry, menu.highlighted or 0)
+        )
+        self._refresh_count()
 
     def _save(self) -> None:
         active_quests = [
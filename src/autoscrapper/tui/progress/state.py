@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import functools
 import re
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from ...config import ProgressSettings, load_progress_settings, save_progress_settings
 from ...progress.data_loader import load_game_data
 from ...progress.quest_inference import infer_completed_from_active
 
+_APOSTROPHES = str.maketrans("", "", "'’")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# load_game_data() hands back the same quest list until the snapshot changes,
+# so entries built from it are reused across menu visits.
+_quest_entries_cache: Optional[Tuple[List[dict], List[QuestEntry]]] = None
+
 
 @dataclass(frozen=True)
 class QuestEntry:
@@ -39,13 +47,73 @@ def iso_now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_quest_value(value: str) -> str:
-    normalized = str(value or "").lower().replace("'", "").replace("’", "")
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+    """
+    Lowercased, punctuation-free form used for quest search and sorting.
+
+    Memoized: the quest list re-normalizes every name on each search keystroke.
+    """
+    normalized = str(value or "").lower().translate(_APOSTROPHES)
+    # Whitespace is non-alphanumeric, so this also collapses runs of spaces.
+    return _NON_ALNUM_RE.sub(" ", normalized).strip()
+
+
+def _fuzzy_contains(pattern: str, text: str, max_edits: int) -> bool:
+    """
+    True if some substring of `text` is within `max_edits` edits of `pattern`.
+    """
+    # Edit-distance DP with a free start/end in `text`; rows only grow, so stop
+    # as soon as every cell in a row is over budget.
+    prev = [0] * (len(text) + 1)
+    for i, p_char in enumerate(pattern, 1):
+        cur = [i]
+        for j, t_char in enumerate(text, 1):
+            cur.append(
+                min(prev[j - 1] + (p_char != t_char), prev[j] + 1, cur[j - 1] + 1)
+            )
+        if min(cur) > max_edits:
+            return False
+        prev = cur
+    return min(prev) <= max_edits
+
+
+def filter_quest_entries(entries: List[QuestEntry], query: str) -> List[QuestEntry]:
+    """
+    Entries whose name or trader contains `query`, or whose id equals it.
+
+    When nothing matches exactly, queries of four or more characters fall back
+    to typo-tolerant matching (one edit, two from eight characters).
+    """
+    normalized = normalize_quest_value(query)
+    if not normalized:
+        return list(entries)
+
+    matches = [
+        entry
+        for entry in entries
+        if normalized in normalize_quest_value(entry.name)
+        or normalized in normalize_quest_value(entry.trader)
+        or normalized == entry.id
+    ]
+    if matches or len(normalized) < 4:
+        return matches
+
+    max_edits = 1 if len(normalized) < 8 else 2
+    return [
+        entry
+        for entry in entries
+        if _fuzzy_contains(normalized, normalize_quest_value(entry.name), max_edits)
+        or _fuzzy_contains(normalized, normalize_quest_value(entry.trader), max_edits)
+    ]
 
 
 def build_quest_entries(quests: List[dict]) -> List[QuestEntry]:
+    global _quest_entries_cache
+    cached = _quest_entries_cache
+    if cached is not None and cached[0] is quests:
+        return list(cached[1])
+
     entries: List[QuestEntry] = []
     for quest in quests:
         quest_id = quest.get("id")
@@ -64,7 +132,8 @@ def build_quest_entries(quests: List[dict]) -> List[QuestEntry]:
             )
         )
     entries.sort(key=lambda entry: (entry.trader, entry.sort_order, entry.name))
-    return entries
+    _quest_entries_cache = (quests, entries)
+    return list(entries)
 
 
 def build_hideout_modules(hideout_modules: List[dict]) -> List[HideoutModule]:
@@ -8,8 +8,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from ..config import has_saved_progress, load_progress_settings
-from ..items.rules_store import load_rules, using_custom_rules
+from ..config import ProgressSettings, has_saved_progress, load_progress_settings
+from ..items.rules_store import load_rules_metadata, using_custom_rules
 from ..progress.data_loader import load_game_data
 
 
@@ -33,16 +33,14 @@ def _format_timestamp(value: str | None) -> str | None:
 
 def _format_rules_status() -> str:
     status = "Custom" if using_custom_rules() else "Default"
-    payload = load_rules()
-    generated_at = payload.get("metadata", {}).get("generatedAt")
+    generated_at = load_rules_metadata().get("generatedAt")
     generated_at = _format_timestamp(generated_at)
     if generated_at:
         return f"{status} (generated {generated_at})"
     return status
 
 
-def _format_progress_status() -> str:
-    settings = load_progress_settings()
+def _format_progress_status(settings: ProgressSettings) -> str:
     if not has_saved_progress(settings):
         return "Not set"
     last_updated = _format_timestamp(settings.last_updated) or "unknown"
@@ -69,15 +67,17 @@ def has_progress() -> bool:
 
 
 def build_status_panel() -> Panel:
+    # One settings load serves both the progress row and the first-run tip.
+    settings = load_progress_settings()
     status_table = Table.grid(padding=(0, 1))
     status_table.add_column(justify="right", style="bold")
     status_table.add_column()
     status_table.add_row("Rules", _format_rules_status())
-    status_table.add_row("Progress", _format_progress_status())
+    status_table.add_row("Progress", _format_progress_status(settings))
     status_table.add_row("Game data", _format_snapshot_status())
 
     tip: Text | None = None
-    if not has_progress():
+    if not has_saved_progress(settings):
         tip = Text(
             "First run: generate a personalized rule list from your quests and workshop level.",
             style="dim",
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("tesserocr")
+
+from autoscrapper.ocr.inventory_vision import INFOBOX_COLOR_BGR, find_infobox
+
+
+def test_region_crop_matches_full_window_detection():
+    # Above 1080p the closing kernel scales with the window; a crop around the
+    # infobox must be detected with the same kernel as the full frame.
+    win_w, win_h = 2560, 1440
+    frame = np.full((win_h, win_w, 3), 40, dtype=np.uint8)
+    frame[300:900, 1200:1600] = INFOBOX_COLOR_BGR
+    frame[340:360, 1200:1600] = (120, 90, 60)
+
+    full_rect = find_infobox(frame)
+    assert full_rect == (1200, 300, 400, 600)
+
+    margin = 48
+    x0, y0 = 1200 - margin, 300 - margin
+    crop = frame[y0 : 900 + margin, x0 : 1600 + margin]
+    x, y, w, h = find_infobox(crop, (win_w, win_h))
+    assert (x0 + x, y0 + y, w, h) == full_rect
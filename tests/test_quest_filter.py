@@ -0,0 +1,53 @@
+from autoscrapper.tui.progress.state import QuestEntry, filter_quest_entries
+
+
+def _entry(quest_id: str, name: str, trader: str) -> QuestEntry:
+    return QuestEntry(
+        id=quest_id,
+        name=name,
+        trader=trader,
+        sort_order=0,
+        has_requirements=False,
+    )
+
+
+SUPPLY_RUN = _entry("q1", "Supply Run", "Celeste")
+SUPPLA_DEPOT = _entry("q2", "Suppla Depot", "Shani")
+RESET_TRAP = _entry("q3", "Reset Trap", "Lance")
+INTO_THE_DARK = _entry("q4", "Into the Dark", "TianWen")
+BROKEN_ANTENNA = _entry("ss14", "Broken Antenna", "Apollo")
+
+ENTRIES = [SUPPLY_RUN, SUPPLA_DEPOT, RESET_TRAP, INTO_THE_DARK, BROKEN_ANTENNA]
+
+
+def _names(query: str) -> list[str]:
+    return [entry.name for entry in filter_quest_entries(ENTRIES, query)]
+
+
+def test_exact_match_suppresses_fuzzy_fallback():
+    # "Suppla Depot" is one edit away, but an exact hit wins outright.
+    assert _names("supply") == ["Supply Run"]
+
+
+def test_one_typo_matches_from_four_characters():
+    assert _names("rset") == ["Reset Trap"]
+
+
+def test_no_fuzzy_matching_below_four_characters():
+    # "trp" is one edit from "trap", but three characters stay exact-only.
+    assert _names("trp") == []
+
+
+def test_two_edits_allowed_from_eight_characters():
+    assert _names("tian wen") == ["Into the Dark"]
+    assert _names("tiam wen") == ["Into the Dark"]
+    # Seven characters only get one edit.
+    assert _names("tiamwem") == []
+
+
+def test_id_equality_match():
+    assert _names("ss14") == ["Broken Antenna"]
+
+
+def test_blank_query_returns_everything():
+    assert filter_quest_entries(ENTRIES, "  ") == ENTRIES